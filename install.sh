@@ -11,10 +11,10 @@ fi
 
 # Check Python version
 python_version=$(python3 -c 'import sys; print(".".join(map(str, sys.version_info[:2])))')
-required_version="3.7"
+required_version="3.9"
 
 if [ "$(printf '%s\n' "$required_version" "$python_version" | sort -V | head -n1)" != "$required_version" ]; then
-    echo "❌ Python 3.7 or higher is required. Found: $python_version"
+    echo "❌ Python 3.9 or higher is required. Found: $python_version"
     exit 1
 fi
 
@@ -8,21 +8,134 @@ This tool provides administrators with simple commands to:
 - Find and clean up stale resources
 """
 
+import asyncio
+import importlib.util
+import io
+import json
 import os
+import re
 import sys
+import time
 import yaml
 import boto3
 import click
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+import numpy as np
+from collections import Counter, defaultdict, deque
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 from kafka.admin import KafkaAdminClient
 from kafka import KafkaConsumer, TopicPartition
-from kafka.errors import KafkaError
+from kafka.errors import KafkaError, NoBrokersAvailable, NodeNotReadyError, NoError
+from kafka.protocol.offset import OffsetRequest, OffsetResetStrategy
 import colorama
 from colorama import Fore, Style
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# aiokafka is only needed by the daemon, so it is imported on first use there
+if TYPE_CHECKING:
+    from aiokafka.admin import AIOKafkaAdminClient
+
+# Only emit colors when writing to a terminal
+_IS_TTY = sys.stdout.isatty()
+
 # Initialize colorama for cross-platform colored output
-colorama.init()
+colorama.init(strip=not _IS_TTY)
+
+
+class _Colors:
+    """Color codes that collapse to empty strings when output is piped."""
+    
+    def __init__(self, enabled: bool):
+        self.RED = Fore.RED if enabled else ''
+        self.GREEN = Fore.GREEN if enabled else ''
+        self.YELLOW = Fore.YELLOW if enabled else ''
+        self.CYAN = Fore.CYAN if enabled else ''
+        self.RESET = Style.RESET_ALL if enabled else ''
+
+
+C = _Colors(_IS_TTY)
+
+MS_PER_DAY = 86_400_000
+
+# Minimum seconds between end-offset samples used to estimate a partition's rate
+MIN_OFFSET_SAMPLE_GAP = 1.0
+
+# Directory holding per-cluster consumer group commit snapshots
+SNAPSHOT_DIR = os.path.expanduser('~/.kafka-lens')
+
+# Maximum number of topics per describe_topics request
+DESCRIBE_TOPICS_BATCH_SIZE = 200
+
+# Seconds to wait for the last record of every partition in verbose unused-topic scans
+LAST_MESSAGE_TIMEOUT = 5.0
+
+
+# Cloud sessions keyed by (profile, region), reused to avoid repeated credential resolution
+_cloud_sessions: Dict[Tuple[Optional[str], str], boto3.Session] = {}
+
+
+def _get_cloud_session(profile: Optional[str], region: str) -> boto3.Session:
+    """Get or create a cached cloud provider session."""
+    key = (profile, region)
+    if key not in _cloud_sessions:
+        _cloud_sessions[key] = boto3.Session(profile_name=profile, region_name=region)
+    return _cloud_sessions[key]
+
+
+# Compiled URP flagging kernel, built on first use since importing numba is slow
+_urp_kernel = None
+
+
+def _under_replicated_jit(topic_metadata: Dict) -> Counter:
+    """Count under-replicated partitions per topic with a parallel numba kernel.
+    
+    The kernel is cached on disk after the first compile. Building its input
+    arrays still walks every partition in Python, so this is not faster than
+    the plain generator in health_check.
+    """
+    global _urp_kernel
+    if _urp_kernel is None:
+        from numba import njit, prange
+        
+        @njit(parallel=True, cache=True)
+        def flag_urp(sizes):
+            flags = np.empty(sizes.shape[0], dtype=np.bool_)
+            for k in prange(sizes.shape[0]):
+                flags[k] = sizes[k, 1] < sizes[k, 0]
+            return flags
+        
+        _urp_kernel = flag_urp
+    
+    topic_names = list(topic_metadata)
+    partition_counts = np.fromiter(
+        (len(topic_info.partitions) for topic_info in topic_metadata.values()),
+        dtype=np.int64, count=len(topic_names)
+    )
+    # One pass over all partitions, interleaving (replicas, isr) sizes
+    sizes = np.fromiter(
+        chain.from_iterable(
+            (len(p.replicas), len(p.isr))
+            for topic_info in topic_metadata.values()
+            for p in topic_info.partitions.values()
+        ),
+        dtype=np.int16, count=2 * int(partition_counts.sum())
+    ).reshape(-1, 2)
+    topic_index = np.repeat(np.arange(len(topic_names)), partition_counts)
+    
+    per_topic = np.bincount(topic_index[_urp_kernel(sizes)], minlength=len(topic_names))
+    return Counter({topic_names[i]: int(per_topic[i]) for i in np.flatnonzero(per_topic)})
+
+
+def _chunked(items: List, size: int) -> Iterator[List]:
+    """Yield successive slices of items with at most size elements each."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
 
 class KafkaLens:
     """Main class for Kafka cluster management operations."""
@@ -32,30 +145,45 @@ class KafkaLens:
         self.config = self._load_config(config_path)
         self.admin_client = None
         self.consumer = None
+        self.async_admin = None
+        self._meta_cache: Dict[Any, Tuple[float, Any]] = {}
+        # Recent (fetched_at, end_offset) observations per partition, used for interpolation
+        self._offset_history: Dict[TopicPartition, Deque[Tuple[float, int]]] = defaultdict(lambda: deque(maxlen=4))
+        # Recent (observed_at, brokers) lookups for cloud clusters, newest last
+        self._bootstrap_history: Deque[Tuple[float, List[str]]] = deque(maxlen=8)
         
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from YAML file."""
         try:
             with open(config_path, 'r') as file:
-                config = yaml.safe_load(file)
+                config = yaml.load(file, Loader=_YamlLoader)
             return config
         except FileNotFoundError:
-            click.echo(f"{Fore.RED}Error: Configuration file '{config_path}' not found.{Style.RESET_ALL}")
+            click.echo(f"{C.RED}Error: Configuration file '{config_path}' not found.{C.RESET}")
             sys.exit(1)
         except yaml.YAMLError as e:
-            click.echo(f"{Fore.RED}Error parsing configuration file: {e}{Style.RESET_ALL}")
+            click.echo(f"{C.RED}Error parsing configuration file: {e}{C.RESET}")
             sys.exit(1)
     
-    def _get_bootstrap_servers(self) -> List[str]:
+    def _get_bootstrap_servers(self, force_refresh: bool = False) -> List[str]:
         """Get bootstrap servers from cloud cluster or static configuration."""
         if 'cluster_arn' in self.config:
-            return self._get_cloud_bootstrap_servers()
-        else:
-            servers = self.config.get('bootstrap_servers', 'localhost:9092')
-            return servers.split(',') if isinstance(servers, str) else servers
+            return self._get_cloud_bootstrap_servers(force_refresh)
+        
+        servers = self.config.get('bootstrap_servers', 'localhost:9092')
+        return servers.split(',') if isinstance(servers, str) else servers
     
-    def _get_cloud_bootstrap_servers(self) -> List[str]:
-        """Get bootstrap servers from cloud-managed Kafka cluster."""
+    def _get_cloud_bootstrap_servers(self, force_refresh: bool = False) -> List[str]:
+        """Get bootstrap servers from cloud-managed Kafka cluster.
+        
+        The last lookup is reused until it is older than bootstrap_max_delay
+        seconds, or force_refresh is set because the brokers were unreachable.
+        """
+        if self._bootstrap_history and not force_refresh:
+            observed_at, brokers = self._bootstrap_history[-1]
+            if time.time() - observed_at <= self.config.get('bootstrap_max_delay', 300):
+                return brokers
+        
         try:
             cluster_arn = self.config.get('cluster_arn')
             if not cluster_arn:
@@ -64,7 +192,7 @@ class KafkaLens:
             region = self.config.get('cloud_region', 'us-west-2')
             profile = self.config.get('cloud_profile')
             
-            session = boto3.Session(profile_name=profile) if profile else boto3.Session()
+            session = _get_cloud_session(profile, region)
             kafka_client = session.client('kafka', region_name=region)
             
             response = kafka_client.get_bootstrap_brokers(
@@ -76,12 +204,24 @@ class KafkaLens:
             if not brokers:
                 brokers = response.get('BootstrapBrokerString', '')
             
-            return brokers.split(',') if brokers else []
+            brokers = brokers.split(',') if brokers else []
+            self._bootstrap_history.append((time.time(), brokers))
+            return brokers
             
         except Exception as e:
-            click.echo(f"{Fore.RED}Error connecting to cloud cluster: {e}{Style.RESET_ALL}")
+            click.echo(f"{C.RED}Error connecting to cloud cluster: {e}{C.RESET}")
             sys.exit(1)
     
+    def _connect(self, client_class, client_config: Dict):
+        """Create a Kafka client, re-resolving cloud bootstrap servers once if none are reachable."""
+        try:
+            return client_class(**client_config)
+        except (NoBrokersAvailable, NodeNotReadyError):
+            if 'cluster_arn' not in self.config:
+                raise
+            client_config['bootstrap_servers'] = self._get_bootstrap_servers(force_refresh=True)
+            return client_class(**client_config)
+    
     def _get_admin_client(self) -> KafkaAdminClient:
         """Get or create Kafka admin client."""
         if self.admin_client is None:
@@ -114,9 +254,9 @@ class KafkaLens:
                 client_config['ssl_context'] = ssl_config
             
             try:
-                self.admin_client = KafkaAdminClient(**client_config)
+                self.admin_client = self._connect(KafkaAdminClient, client_config)
             except Exception as e:
-                click.echo(f"{Fore.RED}Error connecting to Kafka cluster: {e}{Style.RESET_ALL}")
+                click.echo(f"{C.RED}Error connecting to Kafka cluster: {e}{C.RESET}")
                 sys.exit(1)
         
         return self.admin_client
@@ -155,283 +295,721 @@ class KafkaLens:
                 consumer_config['ssl_context'] = ssl_config
             
             try:
-                self.consumer = KafkaConsumer(**consumer_config)
+                self.consumer = self._connect(KafkaConsumer, consumer_config)
             except Exception as e:
-                click.echo(f"{Fore.RED}Error creating Kafka consumer: {e}{Style.RESET_ALL}")
+                click.echo(f"{C.RED}Error creating Kafka consumer: {e}{C.RESET}")
                 sys.exit(1)
         
         return self.consumer
     
-    def health_check(self):
-        """Check cluster health and display summary."""
-        click.echo(f"{Fore.CYAN}🔍 Checking cluster health...{Style.RESET_ALL}")
+    def _cached(self, key, fn: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """Return a cached metadata response, calling fn when missing or older than ttl seconds."""
+        if ttl is None:
+            ttl = self.config.get('metadata_cache_ttl', 30)
+        
+        now = time.monotonic()
+        entry = self._meta_cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        
+        value = fn()
+        self._meta_cache[key] = (now, value)
+        return value
+    
+    def _invalidate_cache(self):
+        """Drop all cached metadata, e.g. after a resource has been deleted."""
+        self._meta_cache.clear()
+    
+    def _cluster_metadata(self) -> Dict:
+        """Return cached metadata for the whole cluster, including every topic.
+        
+        Brokers, controller, cluster id and topic names are all read from this
+        one response, so a run only sends a single full MetadataRequest.
+        """
+        admin_client = self._get_admin_client()
+        return self._cached('metadata', lambda: admin_client._get_cluster_metadata().to_object())
+    
+    def _broker_metadata(self) -> Dict:
+        """Return cached brokers, controller and cluster id without any topic metadata."""
+        # An empty topic list (MetadataRequest v1+) returns only brokers and the controller
+        admin_client = self._get_admin_client()
+        return self._cached('brokers', lambda: admin_client._get_cluster_metadata(topics=[]).to_object())
+    
+    def _topic_names(self) -> List[str]:
+        """Return the names of all topics from the cached cluster metadata."""
+        return [topic['topic'] for topic in self._cluster_metadata()['topics']]
+    
+    def _user_topics(self, topics: List[str]) -> List[str]:
+        """Filter out internal topics and those not matching the configured topic pattern."""
+        include = re.compile(self.config.get('health_check_topic_pattern', '.*'))
+        return [topic for topic in topics if not topic.startswith('__') and include.match(topic)]
+    
+    def health_check(self, jit: bool = False, fast: Optional[bool] = None):
+        """Check cluster health and display summary.
+        
+        With fast (or the fast_health config option), only broker status is
+        checked, using a metadata request for no topics so that the response
+        does not grow with the number of topics. With jit, under-replicated
+        partitions are counted by a compiled numba kernel.
+        """
+        if fast is None:
+            fast = self.config.get('fast_health', False)
+        
+        if jit and importlib.util.find_spec('numba') is None:
+            click.echo(f"{C.RED}Error: --jit requires numba. Install it with: pip install kafka-lens[jit]{C.RESET}")
+            return
+        
+        click.echo(f"{C.CYAN}🔍 Checking cluster health...{C.RESET}")
         
         admin_client = self._get_admin_client()
         
         try:
             # Get cluster metadata
-            metadata = admin_client.describe_cluster()
+            metadata = self._broker_metadata() if fast else self._cluster_metadata()
             
             # Count brokers
             total_brokers = len(metadata['brokers'])
             connected_brokers = len(metadata['nodes'])
             controller_id = metadata['controller']
             
+            if fast:
+                buf = io.StringIO()
+                buf.write(f"\n{C.GREEN}📊 Cluster Health Report:{C.RESET}\n")
+                buf.write(f"  • Brokers Found: {connected_brokers}/{total_brokers} Online\n")
+                buf.write(f"  • Controller ID: {controller_id}\n")
+                
+                if connected_brokers == total_brokers:
+                    buf.write(f"\n{C.GREEN}✅ All brokers are online.{C.RESET}\n")
+                else:
+                    buf.write(f"\n{C.YELLOW}⚠️  Some brokers are offline.{C.RESET}\n")
+                
+                click.echo(buf.getvalue(), nl=False)
+                return
+            
             # Check for under-replicated partitions
-            topics = admin_client.list_topics()
-            non_internal_topics = [topic for topic in topics if not topic.startswith('__')]
+            non_internal_topics = self._user_topics(self._topic_names())
             
-            urp_count = 0
-            if non_internal_topics:
-                topic_metadata = admin_client.describe_topics(non_internal_topics)
+            under_replicated_by_topic = Counter()
+            for chunk in _chunked(non_internal_topics, DESCRIBE_TOPICS_BATCH_SIZE):
+                topic_metadata = self._cached(
+                    ('describe_topics', tuple(chunk)),
+                    lambda: admin_client.describe_topics(chunk)
+                )
                 
-                for topic_name, topic_info in topic_metadata.items():
-                    for partition_id, partition_info in topic_info.partitions.items():
-                        replicas_count = len(partition_info.replicas)
-                        isr_count = len(partition_info.isr)
-                        if isr_count < replicas_count:
-                            urp_count += 1
+                if jit:
+                    under_replicated_by_topic.update(_under_replicated_jit(topic_metadata))
+                else:
+                    under_replicated_by_topic.update(
+                        topic_name
+                        for topic_name, topic_info in topic_metadata.items()
+                        for partition_info in topic_info.partitions.values()
+                        if len(partition_info.isr) < len(partition_info.replicas)
+                    )
+            urp_count = sum(under_replicated_by_topic.values())
             
             # Display results
-            click.echo(f"\n{Fore.GREEN}📊 Cluster Health Report:{Style.RESET_ALL}")
-            click.echo(f"  • Brokers Found: {connected_brokers}/{total_brokers} Online")
-            click.echo(f"  • Controller ID: {controller_id}")
+            buf = io.StringIO()
+            buf.write(f"\n{C.GREEN}📊 Cluster Health Report:{C.RESET}\n")
+            buf.write(f"  • Brokers Found: {connected_brokers}/{total_brokers} Online\n")
+            buf.write(f"  • Controller ID: {controller_id}\n")
             
             if urp_count == 0:
-                click.echo(f"  • Under-replicated Partitions: {urp_count} {Fore.GREEN}(OK){Style.RESET_ALL}")
+                buf.write(f"  • Under-replicated Partitions: {urp_count} {C.GREEN}(OK){C.RESET}\n")
             else:
-                click.echo(f"  • Under-replicated Partitions: {urp_count} {Fore.RED}(WARNING){Style.RESET_ALL}")
+                buf.write(f"  • Under-replicated Partitions: {urp_count} {C.RED}(WARNING){C.RESET}\n")
+                for topic_name, count in under_replicated_by_topic.most_common():
+                    buf.write(f"      - {topic_name}: {count}\n")
             
             # Overall health status
             if connected_brokers == total_brokers and urp_count == 0:
-                click.echo(f"\n{Fore.GREEN}✅ Cluster is healthy!{Style.RESET_ALL}")
+                buf.write(f"\n{C.GREEN}✅ Cluster is healthy!{C.RESET}\n")
             else:
-                click.echo(f"\n{Fore.YELLOW}⚠️  Cluster has issues that need attention.{Style.RESET_ALL}")
+                buf.write(f"\n{C.YELLOW}⚠️  Cluster has issues that need attention.{C.RESET}\n")
+            
+            click.echo(buf.getvalue(), nl=False)
                 
         except Exception as e:
-            click.echo(f"{Fore.RED}Error during health check: {e}{Style.RESET_ALL}")
+            click.echo(f"{C.RED}Error during health check: {e}{C.RESET}")
+    
+    def _wait_all(self, futures):
+        """Poll until every request future has completed, without raising on failures."""
+        admin_client = self._get_admin_client()
+        for future in futures:
+            while not future.is_done:
+                admin_client._client.poll(future=future)
+    
+    def _list_all_group_offsets(self, groups: List) -> Dict:
+        """Fetch committed offsets for many consumer groups at once.
+        
+        FindCoordinator and OffsetFetch requests are each pipelined before
+        waiting, so the scan costs roughly one round-trip per coordinator rather
+        than one per group. Groups whose coordinator or offsets could not be
+        fetched are reported and omitted from the result.
+        """
+        admin_client = self._get_admin_client()
+        if not groups:
+            return {}
+        
+        coordinator_futures = {
+            group_id: admin_client._find_coordinator_id_send_request(group_id)
+            for group_id in groups
+        }
+        self._wait_all(coordinator_futures.values())
+        
+        # Sending grouped by coordinator keeps each broker's requests together
+        coordinator_groups = defaultdict(list)
+        for group_id, future in coordinator_futures.items():
+            try:
+                if future.failed():
+                    raise future.exception
+                coordinator_id = admin_client._find_coordinator_id_process_response(future.value)
+                coordinator_groups[coordinator_id].append(group_id)
+            except Exception as e:
+                click.echo(f"{C.YELLOW}Warning: Could not find coordinator for group '{group_id}': {e}{C.RESET}")
+        
+        futures = {}
+        for coordinator_id, group_ids in coordinator_groups.items():
+            for group_id in group_ids:
+                futures[group_id] = admin_client._list_consumer_group_offsets_send_request(
+                    group_id, coordinator_id
+                )
+        self._wait_all(futures.values())
+        
+        all_offsets = {}
+        for group_id, future in futures.items():
+            try:
+                if future.failed():
+                    raise future.exception
+                all_offsets[group_id] = admin_client._list_consumer_group_offsets_process_response(future.value)
+            except Exception as e:
+                click.echo(f"{C.YELLOW}Warning: Could not fetch offsets for group '{group_id}': {e}{C.RESET}")
+        
+        return all_offsets
+    
+    def _leader_for(self, tp: TopicPartition) -> Optional[int]:
+        """Return the leader of tp from the client's cached cluster metadata, or None if unknown."""
+        leader = self._get_admin_client()._client.cluster.leader_for_partition(tp)
+        return leader if leader is not None and leader >= 0 else None
+    
+    def _get_end_offsets(self, partitions: List[TopicPartition]) -> Dict:
+        """Get latest offsets, estimating them from recent fetches when interpolation is enabled.
+        
+        With interpolation, a partition is only re-fetched once its last real
+        fetch is older than offset_refresh_interval seconds; in between, its end
+        offset is extrapolated from the rate between its last two fetches, and
+        never further past the last fetch than the gap that rate was measured
+        over.
+        """
+        if not self.config.get('interpolate', False):
+            return self._fetch_end_offsets(partitions)
+        
+        now = time.time()
+        refresh_interval = self.config.get('offset_refresh_interval', 120)
+        
+        end_offsets = {}
+        to_fetch = []
+        for tp in partitions:
+            history = self._offset_history.get(tp)
+            if history and len(history) >= 2 and now - history[-1][0] < refresh_interval:
+                (t1, o1), (t2, o2) = history[-2], history[-1]
+                rate = max(0, (o2 - o1) / (t2 - t1))
+                end_offsets[tp] = int(o2 + rate * min(now - t2, t2 - t1))
+            else:
+                to_fetch.append(tp)
+        
+        if to_fetch:
+            fetched = self._fetch_end_offsets(to_fetch)
+            for tp, offset in fetched.items():
+                history = self._offset_history[tp]
+                # Samples taken too close together give a meaningless rate
+                if history and now - history[-1][0] < MIN_OFFSET_SAMPLE_GAP:
+                    history[-1] = (history[-1][0], offset)
+                else:
+                    history.append((now, offset))
+            end_offsets.update(fetched)
+        
+        return end_offsets
+    
+    def _request_end_offsets(self, partitions: List[TopicPartition]) -> Tuple[Dict, List[TopicPartition]]:
+        """Send one ListOffsets request per partition leader and wait for all of them.
+        
+        Returns the end offsets that were fetched and the partitions that were
+        not: those without a known leader, those that returned an error code and
+        those whose leader's request failed. A failed request only affects its
+        own leader's partitions.
+        """
+        admin_client = self._get_admin_client()
+        
+        leader_map = defaultdict(list)
+        for tp in partitions:
+            leader_map[self._leader_for(tp)].append(tp)
+        
+        failed = leader_map.pop(None, [])
+        
+        futures = {}
+        for leader, tps in leader_map.items():
+            topics = defaultdict(list)
+            for tp in tps:
+                topics[tp.topic].append((tp.partition, OffsetResetStrategy.LATEST))
+            request = OffsetRequest[1](replica_id=-1, topics=list(topics.items()))
+            try:
+                futures[leader] = admin_client._send_request_to_node(leader, request)
+            except Exception as e:
+                click.echo(f"{C.YELLOW}Warning: Could not request end offsets from broker {leader}: {e}{C.RESET}")
+                failed.extend(tps)
+        self._wait_all(futures.values())
+        
+        end_offsets = {}
+        for leader, future in futures.items():
+            if future.failed():
+                click.echo(f"{C.YELLOW}Warning: Could not fetch end offsets from broker {leader}: "
+                           f"{future.exception}{C.RESET}")
+                failed.extend(leader_map[leader])
+                continue
+            for topic, partition_infos in future.value.topics:
+                for partition, error_code, _timestamp, offset in partition_infos:
+                    if error_code == 0:
+                        end_offsets[TopicPartition(topic, partition)] = offset
+                    else:
+                        failed.append(TopicPartition(topic, partition))
+        
+        return end_offsets, failed
+    
+    def _fetch_end_offsets(self, partitions: List[TopicPartition]) -> Dict:
+        """Fetch latest offsets with one ListOffsets request per partition leader.
+        
+        Partitions that could not be fetched (unknown or stale leader, or a
+        failed broker request) are retried once after the cluster metadata has
+        been refreshed; any still missing are reported and omitted.
+        
+        The admin client is not thread-safe, so this must only be called from
+        one thread at a time.
+        """
+        end_offsets, failed = self._request_end_offsets(partitions)
+        
+        if failed:
+            # Leaders may have moved; refresh metadata and retry these once
+            admin_client = self._get_admin_client()
+            self._wait_all([admin_client._client.cluster.request_update()])
+            retried, failed = self._request_end_offsets(failed)
+            end_offsets.update(retried)
+        
+        if failed:
+            click.echo(f"{C.YELLOW}Warning: Could not fetch end offsets for {len(failed)} partition(s); "
+                       f"lag for their groups is under-reported.{C.RESET}")
+        
+        return end_offsets
+    
+    def _group_lag(self, committed_offsets: Dict, latest_offsets: Dict) -> Optional[int]:
+        """Calculate the total lag for a single consumer group, or None if it has no commits."""
+        if not committed_offsets:
+            return None
+        
+        known = [tp for tp in committed_offsets if tp in latest_offsets]
+        committed = np.fromiter((committed_offsets[tp].offset for tp in known), dtype=np.int64, count=len(known))
+        latest = np.fromiter((latest_offsets[tp] for tp in known), dtype=np.int64, count=len(known))
+        return int(np.maximum(latest - committed, 0).sum())
+    
+    def _lags_for_groups(self, all_offsets: Dict) -> Dict:
+        """Calculate lag for every group from a single end-offset fetch covering all their partitions."""
+        partitions = list({tp for committed_offsets in all_offsets.values() for tp in committed_offsets})
+        latest_offsets = self._get_end_offsets(partitions) if partitions else {}
+        
+        group_lags = {}
+        for group_id, committed_offsets in all_offsets.items():
+            total_lag = self._group_lag(committed_offsets, latest_offsets)
+            if total_lag is not None:
+                group_lags[group_id] = total_lag
+        return group_lags
     
     def check_lag(self):
         """Check consumer group lag."""
-        click.echo(f"{Fore.CYAN}🔍 Checking consumer group lag...{Style.RESET_ALL}")
+        click.echo(f"{C.CYAN}🔍 Checking consumer group lag...{C.RESET}")
         
         admin_client = self._get_admin_client()
-        lag_threshold = self.config.get('lag_threshold', 1000)
         
         try:
             # Get all consumer groups
             groups = admin_client.list_consumer_groups()
-            group_lags = {}
+            all_offsets = self._list_all_group_offsets(groups)
+            group_lags = self._lags_for_groups(all_offsets)
             
-            for group_id in groups:
-                try:
-                    # Get committed offsets
-                    committed_offsets = admin_client.list_consumer_group_offsets(group_id)
-                    
-                    if not committed_offsets:
-                        continue
-                    
-                    # Get latest offsets for the same partitions
-                    partitions = list(committed_offsets.keys())
-                    latest_offsets = admin_client.get_topic_end_offsets(partitions)
-                    
-                    # Calculate total lag for this group
-                    total_lag = 0
-                    for tp in partitions:
-                        if tp in latest_offsets:
-                            committed_offset = committed_offsets[tp].offset
-                            latest_offset = latest_offsets[tp]
-                            partition_lag = max(0, latest_offset - committed_offset)
-                            total_lag += partition_lag
-                    
-                    group_lags[group_id] = total_lag
-                    
-                except Exception as e:
-                    click.echo(f"{Fore.YELLOW}Warning: Could not check lag for group '{group_id}': {e}{Style.RESET_ALL}")
-                    continue
+            self._report_lag(group_lags)
+                
+        except Exception as e:
+            click.echo(f"{C.RED}Error during lag check: {e}{C.RESET}")
+    
+    def _report_lag(self, group_lags: Dict):
+        """Display the consumer group lag report."""
+        lag_threshold = self.config.get('lag_threshold', 1000)
+        
+        if not group_lags:
+            click.echo(f"{C.YELLOW}No consumer groups found or accessible.{C.RESET}")
+            return
+        
+        buf = io.StringIO()
+        buf.write(f"\n{C.GREEN}📊 Consumer Group Lag Report:{C.RESET}\n")
+        
+        high_lag_groups = []
+        for group_id, lag in group_lags.items():
+            if lag > lag_threshold:
+                high_lag_groups.append((group_id, lag))
+                buf.write(f"  • {group_id}: {C.RED}{lag:,} messages{C.RESET} (HIGH LAG)\n")
+            else:
+                buf.write(f"  • {group_id}: {C.GREEN}{lag:,} messages{C.RESET}\n")
+        
+        if high_lag_groups:
+            buf.write(f"\n{C.RED}⚠️  {len(high_lag_groups)} consumer group(s) have high lag!{C.RESET}\n")
+        else:
+            buf.write(f"\n{C.GREEN}✅ All consumer groups are within normal lag thresholds.{C.RESET}\n")
+        
+        click.echo(buf.getvalue(), nl=False)
+    
+    async def _get_async_admin_client(self) -> 'AIOKafkaAdminClient':
+        """Get or create the asyncio admin client used by daemon mode."""
+        if self.async_admin is None:
+            from aiokafka.admin import AIOKafkaAdminClient
+            from aiokafka.helpers import create_ssl_context
             
-            # Display results
-            if not group_lags:
-                click.echo(f"{Fore.YELLOW}No consumer groups found or accessible.{Style.RESET_ALL}")
-                return
+            client_config = {
+                'bootstrap_servers': self._get_bootstrap_servers(),
+                'client_id': 'kafka-lens',
+                'security_protocol': self.config.get('security_protocol', 'PLAINTEXT')
+            }
             
-            click.echo(f"\n{Fore.GREEN}📊 Consumer Group Lag Report:{Style.RESET_ALL}")
+            # Add SASL configuration if specified
+            if 'sasl_mechanism' in self.config:
+                client_config.update({
+                    'sasl_mechanism': self.config['sasl_mechanism'],
+                    'sasl_plain_username': self.config.get('sasl_plain_username'),
+                    'sasl_plain_password': self.config.get('sasl_plain_password')
+                })
             
-            high_lag_groups = []
-            for group_id, lag in group_lags.items():
-                if lag > lag_threshold:
-                    high_lag_groups.append((group_id, lag))
-                    click.echo(f"  • {group_id}: {Fore.RED}{lag:,} messages{Style.RESET_ALL} (HIGH LAG)")
-                else:
-                    click.echo(f"  • {group_id}: {Fore.GREEN}{lag:,} messages{Style.RESET_ALL}")
+            # Add SSL configuration if specified
+            if any(key in self.config for key in ('ssl_cafile', 'ssl_certfile', 'ssl_keyfile')):
+                client_config['ssl_context'] = create_ssl_context(
+                    cafile=self.config.get('ssl_cafile'),
+                    certfile=self.config.get('ssl_certfile'),
+                    keyfile=self.config.get('ssl_keyfile')
+                )
             
-            if high_lag_groups:
-                click.echo(f"\n{Fore.RED}⚠️  {len(high_lag_groups)} consumer group(s) have high lag!{Style.RESET_ALL}")
+            self.async_admin = AIOKafkaAdminClient(**client_config)
+            await self.async_admin.start()
+        
+        return self.async_admin
+    
+    async def _collect_all(self) -> Dict:
+        """Collect lag for every consumer group, fetching committed offsets concurrently."""
+        async_admin = await self._get_async_admin_client()
+        groups = await async_admin.list_consumer_groups()
+        
+        results = await asyncio.gather(
+            *[async_admin.list_consumer_group_offsets(group_id) for group_id in groups],
+            return_exceptions=True
+        )
+        
+        all_offsets = {}
+        for group_id, result in zip(groups, results):
+            if isinstance(result, Exception):
+                click.echo(f"{C.YELLOW}Warning: Could not check lag for group '{group_id}': {result}{C.RESET}")
             else:
-                click.echo(f"\n{Fore.GREEN}✅ All consumer groups are within normal lag thresholds.{Style.RESET_ALL}")
+                all_offsets[group_id] = result
+        
+        # End offsets come from the synchronous client; one executor call keeps it single-threaded
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._lags_for_groups, all_offsets)
+    
+    async def run_daemon(self, interval: int):
+        """Run health and lag checks every interval seconds until cancelled."""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                click.echo(f"{C.CYAN}🕒 {time.strftime('%Y-%m-%d %H:%M:%S')}{C.RESET}")
+                # Metadata should be fresh each cycle; the client connections are what get reused
+                self._invalidate_cache()
+                await loop.run_in_executor(None, self.health_check)
                 
+                click.echo(f"{C.CYAN}🔍 Checking consumer group lag...{C.RESET}")
+                try:
+                    self._report_lag(await self._collect_all())
+                except Exception as e:
+                    click.echo(f"{C.RED}Error during lag check: {e}{C.RESET}")
+                
+                await asyncio.sleep(interval)
+        finally:
+            if self.async_admin is not None:
+                await self.async_admin.close()
+                self.async_admin = None
+    
+    def _snapshot_path(self) -> str:
+        """Path of the commit timestamp snapshot for the current cluster."""
+        metadata = self._broker_metadata()
+        cluster_id = metadata.get('cluster_id') or 'default'
+        return os.path.join(SNAPSHOT_DIR, f"{cluster_id}.json")
+    
+    def _load_snapshot(self) -> Dict[str, List[int]]:
+        """Load cached {group_id: [latest_commit_ts, checked_at_ms]} from disk, or an empty dict."""
+        try:
+            with open(self._snapshot_path(), 'r') as file:
+                snapshot = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        
+        # Ignore entries that do not match the expected format
+        return {
+            group_id: entry for group_id, entry in snapshot.items()
+            if isinstance(entry, list) and len(entry) == 2
+        }
+    
+    def _save_snapshot(self, snapshot: Dict[str, List[int]]):
+        """Persist {group_id: [latest_commit_ts, checked_at_ms]} to disk."""
+        try:
+            path = self._snapshot_path()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as file:
+                json.dump(snapshot, file)
+        except (OSError, TypeError) as e:
+            click.echo(f"{C.YELLOW}Warning: Could not save consumer group snapshot: {e}{C.RESET}")
+    
+    def _active_groups(self, group_ids: List) -> set:
+        """Return the groups that currently have members or are not Empty/Dead.
+        
+        If the groups cannot be described, all of them are treated as active.
+        """
+        if not group_ids:
+            return set()
+        
+        admin_client = self._get_admin_client()
+        try:
+            descriptions = admin_client.describe_consumer_groups(group_ids)
         except Exception as e:
-            click.echo(f"{Fore.RED}Error during lag check: {e}{Style.RESET_ALL}")
+            click.echo(f"{C.YELLOW}Warning: Could not describe consumer groups: {e}{C.RESET}")
+            return set(group_ids)
+        
+        return {
+            description.group for description in descriptions
+            if description.members or description.state not in ('Empty', 'Dead')
+        }
+    
+    def _fetch_latest_commits(self, group_ids: List, now_ms: int) -> Dict[str, List[int]]:
+        """Fetch [latest_commit_ts, checked_at_ms] for each group; 0 means no commits."""
+        latest_commits = {}
+        for group_id, offsets in self._list_all_group_offsets(group_ids).items():
+            # Find the most recent commit timestamp
+            timestamps = np.fromiter(
+                (offset.commit_timestamp for offset in offsets.values()), dtype=np.int64, count=len(offsets)
+            )
+            latest_commits[group_id] = [int(timestamps.max()) if len(timestamps) else 0, now_ms]
+        return latest_commits
     
-    def find_stale_consumers(self):
-        """Find stale consumer groups."""
-        click.echo(f"{Fore.CYAN}🔍 Finding stale consumer groups...{Style.RESET_ALL}")
+    def find_stale_consumers(self, refresh: bool = False):
+        """Find stale consumer groups.
+        
+        Groups already known to be stale from a previous run are not re-queried
+        until their snapshot entry is older than snapshot_max_age_hours, unless
+        refresh is set. Before such a cached group is reported, its state is
+        re-verified so a group that has become active again is re-queried.
+        """
+        click.echo(f"{C.CYAN}🔍 Finding stale consumer groups...{C.RESET}")
         
         admin_client = self._get_admin_client()
         stale_days = self.config.get('stale_consumer_days', 30)
-        threshold_ts = (datetime.now() - timedelta(days=stale_days)).timestamp() * 1000
+        now_ms = int(time.time() * 1000)
+        threshold_ts = now_ms - stale_days * MS_PER_DAY
         
         try:
             groups = admin_client.list_consumer_groups()
-            stale_groups = []
             
-            for group_id in groups:
-                try:
-                    offsets = admin_client.list_consumer_group_offsets(group_id)
-                    
-                    if not offsets:
-                        # Group has no commits, consider it stale
-                        stale_groups.append((group_id, "No commits"))
-                        continue
-                    
-                    # Find the most recent commit timestamp
-                    latest_commit = max(offset.commit_timestamp for offset in offsets.values())
-                    
-                    if latest_commit < threshold_ts:
-                        days_old = (datetime.now().timestamp() * 1000 - latest_commit) / (1000 * 60 * 60 * 24)
-                        stale_groups.append((group_id, f"{days_old:.1f} days old"))
-                        
-                except Exception as e:
-                    click.echo(f"{Fore.YELLOW}Warning: Could not check group '{group_id}': {e}{Style.RESET_ALL}")
-                    continue
+            max_age_ms = self.config.get('snapshot_max_age_hours', 24) * 60 * 60 * 1000
+            
+            # [latest commit timestamp, time checked] per group; 0 means the group has no commits
+            snapshot = {} if refresh else self._load_snapshot()
+            to_check = [group_id for group_id in groups
+                        if group_id not in snapshot
+                        or snapshot[group_id][0] >= threshold_ts
+                        or now_ms - snapshot[group_id][1] > max_age_ms]
+            snapshot.update(self._fetch_latest_commits(to_check, now_ms))
+            
+            # Re-check cached stale groups that have become active since they were stored
+            cached_stale = [group_id for group_id in groups
+                            if group_id in snapshot and snapshot[group_id][1] != now_ms]
+            snapshot.update(self._fetch_latest_commits(list(self._active_groups(cached_stale)), now_ms))
+            
+            # Drop groups that no longer exist
+            snapshot = {group_id: snapshot[group_id] for group_id in groups if group_id in snapshot}
+            self._save_snapshot(snapshot)
+            
+            stale_groups = []
+            for group_id, (latest_commit, _checked_at) in snapshot.items():
+                if latest_commit == 0:
+                    # Group has no commits, consider it stale
+                    stale_groups.append((group_id, "No commits"))
+                elif latest_commit < threshold_ts:
+                    days_old = (now_ms - latest_commit) / MS_PER_DAY
+                    stale_groups.append((group_id, f"{days_old:.1f} days old"))
             
             # Display results
+            buf = io.StringIO()
             if stale_groups:
-                click.echo(f"\n{Fore.YELLOW}📊 Found {len(stale_groups)} stale consumer groups:{Style.RESET_ALL}")
+                buf.write(f"\n{C.YELLOW}📊 Found {len(stale_groups)} stale consumer groups:{C.RESET}\n")
                 for group_id, reason in stale_groups:
-                    click.echo(f"  • {group_id}: {reason}")
+                    buf.write(f"  • {group_id}: {reason}\n")
             else:
-                click.echo(f"\n{Fore.GREEN}✅ No stale consumer groups found.{Style.RESET_ALL}")
+                buf.write(f"\n{C.GREEN}✅ No stale consumer groups found.{C.RESET}\n")
+            
+            click.echo(buf.getvalue(), nl=False)
                 
         except Exception as e:
-            click.echo(f"{Fore.RED}Error finding stale consumers: {e}{Style.RESET_ALL}")
+            click.echo(f"{C.RED}Error finding stale consumers: {e}{C.RESET}")
     
-    def find_unused_topics(self):
+    def _last_message_timestamp(self, topic_partitions: List[TopicPartition], end_offsets: Dict) -> int:
+        """Read the last record of each partition and return the newest timestamp.
+        
+        Polls until every non-empty partition has returned a record, or until
+        LAST_MESSAGE_TIMEOUT seconds have passed.
+        """
+        consumer = self._get_consumer()
+        latest_timestamp = 0
+        
+        pending = {tp for tp in topic_partitions if end_offsets[tp] > 0}
+        if not pending:
+            return latest_timestamp
+        
+        try:
+            consumer.assign(list(pending))
+            for tp in pending:
+                # Seek to the last message
+                consumer.seek(tp, end_offsets[tp] - 1)
+            
+            # Partitions on different leaders may arrive in separate polls
+            deadline = time.monotonic() + LAST_MESSAGE_TIMEOUT
+            while pending:
+                remaining_ms = int((deadline - time.monotonic()) * 1000)
+                if remaining_ms <= 0:
+                    break
+                
+                messages = consumer.poll(timeout_ms=min(remaining_ms, 1000))
+                for tp, msgs in messages.items():
+                    pending.discard(tp)
+                    for msg in msgs:
+                        if hasattr(msg, 'timestamp') and msg.timestamp:
+                            latest_timestamp = max(latest_timestamp, msg.timestamp)
+        finally:
+            consumer.unassign()
+        
+        return latest_timestamp
+    
+    def find_unused_topics(self, verbose: bool = False):
         """Find unused topics."""
-        click.echo(f"{Fore.CYAN}🔍 Finding unused topics...{Style.RESET_ALL}")
+        click.echo(f"{C.CYAN}🔍 Finding unused topics...{C.RESET}")
         
-        admin_client = self._get_admin_client()
         consumer = self._get_consumer()
         unused_days = self.config.get('unused_topic_days', 90)
-        threshold_ts = (datetime.now() - timedelta(days=unused_days)).timestamp() * 1000
+        now_ms = int(time.time() * 1000)
+        threshold_ts = now_ms - unused_days * MS_PER_DAY
         
         try:
             # Get all non-internal topics
-            topics = admin_client.list_topics()
-            non_internal_topics = [topic for topic in topics if not topic.startswith('__')]
+            non_internal_topics = self._user_topics(self._topic_names())
+            
+            # Collect partitions for all topics so offsets can be looked up in one shot
+            topic_partitions = {}
+            for topic in non_internal_topics:
+                partitions = consumer.partitions_for_topic(topic)
+                if partitions:
+                    topic_partitions[topic] = [TopicPartition(topic, p) for p in partitions]
+            
+            tp_list = [tp for tps in topic_partitions.values() for tp in tps]
+            if tp_list:
+                end_offsets = consumer.end_offsets(tp_list)
+                # Time-index lookup: None means no message at or after the threshold
+                recent_offsets = consumer.offsets_for_times({tp: threshold_ts for tp in tp_list})
+            else:
+                end_offsets, recent_offsets = {}, {}
             
             unused_topics = []
             
-            for topic in non_internal_topics:
-                try:
-                    # Get partitions for this topic
-                    partitions = consumer.partitions_for_topic(topic)
-                    if not partitions:
-                        continue
-                    
-                    # Create TopicPartition objects
-                    topic_partitions = [TopicPartition(topic, p) for p in partitions]
-                    
-                    # Assign partitions to consumer
-                    consumer.assign(topic_partitions)
-                    
-                    # Get end offsets
-                    end_offsets = consumer.end_offsets(topic_partitions)
-                    
-                    # Find the latest message timestamp across all partitions
-                    latest_timestamp = 0
-                    for tp in topic_partitions:
-                        if end_offsets[tp] > 0:
-                            # Seek to the last message
-                            consumer.seek(tp, max(0, end_offsets[tp] - 1))
-                            
-                            # Poll for one message to get timestamp
-                            messages = consumer.poll(timeout_ms=1000)
-                            for msg_tp, msgs in messages.items():
-                                if msg_tp == tp and msgs:
-                                    for msg in msgs:
-                                        if hasattr(msg, 'timestamp') and msg.timestamp:
-                                            latest_timestamp = max(latest_timestamp, msg.timestamp)
-                    
-                    # Unassign partitions before moving to next topic
-                    consumer.unassign()
-                    
-                    if latest_timestamp > 0 and latest_timestamp < threshold_ts:
-                        days_old = (datetime.now().timestamp() * 1000 - latest_timestamp) / (1000 * 60 * 60 * 24)
-                        unused_topics.append((topic, f"{days_old:.1f} days old"))
-                    elif latest_timestamp == 0:
-                        # Topic exists but has no messages
-                        unused_topics.append((topic, "No messages"))
-                        
-                except Exception as e:
-                    click.echo(f"{Fore.YELLOW}Warning: Could not check topic '{topic}': {e}{Style.RESET_ALL}")
-                    # Ensure partitions are unassigned even on error
-                    try:
-                        consumer.unassign()
-                    except:
-                        pass
+            for topic, tps in topic_partitions.items():
+                if all(end_offsets[tp] == 0 for tp in tps):
+                    # Topic exists but has no messages
+                    unused_topics.append((topic, "No messages"))
                     continue
+                
+                if not all(end_offsets[tp] == 0 or recent_offsets[tp] is None for tp in tps):
+                    continue
+                
+                reason = f"No messages in the last {unused_days} days"
+                if verbose:
+                    try:
+                        latest_timestamp = self._last_message_timestamp(tps, end_offsets)
+                        if latest_timestamp > 0:
+                            days_old = (now_ms - latest_timestamp) / MS_PER_DAY
+                            reason = f"{days_old:.1f} days old"
+                    except Exception as e:
+                        click.echo(f"{C.YELLOW}Warning: Could not read last message for topic '{topic}': {e}{C.RESET}")
+                
+                unused_topics.append((topic, reason))
             
             # Display results
+            buf = io.StringIO()
             if unused_topics:
-                click.echo(f"\n{Fore.YELLOW}📊 Found {len(unused_topics)} unused topics:{Style.RESET_ALL}")
+                buf.write(f"\n{C.YELLOW}📊 Found {len(unused_topics)} unused topics:{C.RESET}\n")
                 for topic, reason in unused_topics:
-                    click.echo(f"  • {topic}: {reason}")
+                    buf.write(f"  • {topic}: {reason}\n")
             else:
-                click.echo(f"\n{Fore.GREEN}✅ No unused topics found.{Style.RESET_ALL}")
+                buf.write(f"\n{C.GREEN}✅ No unused topics found.{C.RESET}\n")
+            
+            click.echo(buf.getvalue(), nl=False)
                 
         except Exception as e:
-            click.echo(f"{Fore.RED}Error finding unused topics: {e}{Style.RESET_ALL}")
+            click.echo(f"{C.RED}Error finding unused topics: {e}{C.RESET}")
     
-    def delete_consumer_group(self, group_name: str):
+    def delete_consumer_group(self, group_name: str, yes: bool = False):
         """Delete a consumer group."""
+        self.delete_consumer_groups([group_name], yes=yes)
+    
+    def delete_consumer_groups(self, group_names: List[str], yes: bool = False):
+        """Delete consumer groups, sending one request per coordinator."""
         admin_client = self._get_admin_client()
         
         # Safety prompt
-        confirm = click.prompt(
-            f"Are you sure you want to delete consumer group '{group_name}'? This cannot be undone. [y/N]",
-            default='N'
-        )
-        
-        if confirm.lower() != 'y':
+        names = ', '.join(f"'{group_name}'" for group_name in group_names)
+        if not yes and not click.confirm(
+            f"Are you sure you want to delete consumer group(s) {names}? This cannot be undone.",
+            default=False
+        ):
             click.echo("Operation cancelled.")
             return
         
         try:
-            admin_client.delete_consumer_groups([group_name])
-            click.echo(f"{Fore.GREEN}✅ Successfully deleted consumer group '{group_name}'.{Style.RESET_ALL}")
+            results = admin_client.delete_consumer_groups(group_names)
+            self._invalidate_cache()
+            for group_name, error in results:
+                if error is NoError:
+                    click.echo(f"{C.GREEN}✅ Successfully deleted consumer group '{group_name}'.{C.RESET}")
+                else:
+                    click.echo(f"{C.RED}Error deleting consumer group '{group_name}': {error.__name__}{C.RESET}")
         except Exception as e:
-            click.echo(f"{Fore.RED}Error deleting consumer group: {e}{Style.RESET_ALL}")
+            click.echo(f"{C.RED}Error deleting consumer group: {e}{C.RESET}")
     
-    def delete_topic(self, topic_name: str):
+    def delete_topic(self, topic_name: str, yes: bool = False):
         """Delete a topic."""
         admin_client = self._get_admin_client()
         
         # Safety prompt
-        confirm = click.prompt(
-            f"Are you sure you want to delete topic '{topic_name}'? This cannot be undone. [y/N]",
-            default='N'
-        )
-        
-        if confirm.lower() != 'y':
+        if not yes and not click.confirm(
+            f"Are you sure you want to delete topic '{topic_name}'? This cannot be undone.",
+            default=False
+        ):
             click.echo("Operation cancelled.")
             return
         
         try:
             admin_client.delete_topics([topic_name])
-            click.echo(f"{Fore.GREEN}✅ Successfully deleted topic '{topic_name}'.{Style.RESET_ALL}")
+            self._invalidate_cache()
+            click.echo(f"{C.GREEN}✅ Successfully deleted topic '{topic_name}'.{C.RESET}")
         except Exception as e:
-            click.echo(f"{Fore.RED}Error deleting topic: {e}{Style.RESET_ALL}")
+            click.echo(f"{C.RED}Error deleting topic: {e}{C.RESET}")
     
     def close(self):
         """Close connections."""
@@ -451,11 +1029,13 @@ def cli(ctx, config):
 
 
 @cli.command()
+@click.option('--fast', is_flag=True, default=None, help='Only check broker status, skipping the per-topic scan')
+@click.option('--jit', is_flag=True, help='Count under-replicated partitions with numba (experimental; not faster than the default)')
 @click.pass_context
-def health_check(ctx):
+def health_check(ctx, fast, jit):
     """Check cluster health and display summary."""
     commander = ctx.obj['commander']
-    commander.health_check()
+    commander.health_check(jit=jit, fast=fast)
 
 
 @cli.command()
@@ -466,6 +1046,24 @@ def check_lag(ctx):
     commander.check_lag()
 
 
+@cli.command()
+@click.option('--interval', '-i', default=30, show_default=True, help='Seconds between checks')
+@click.option('--interpolate', is_flag=True, help='Estimate end offsets between real fetches')
+@click.pass_context
+def daemon(ctx, interval, interpolate):
+    """Run health and lag checks periodically over one connection."""
+    commander = ctx.obj['commander']
+    if interpolate:
+        commander.config['interpolate'] = True
+    if commander.config.get('interpolate'):
+        # Re-fetch real offsets every few cycles so estimates are used in between
+        commander.config.setdefault('offset_refresh_interval', interval * 4)
+    try:
+        asyncio.run(commander.run_daemon(interval))
+    finally:
+        commander.close()
+
+
 @cli.group()
 def find():
     """Find unused resources."""
@@ -473,19 +1071,21 @@ def find():
 
 
 @find.command('stale-consumers')
+@click.option('--refresh', is_flag=True, help='Ignore the cached snapshot and re-check every group')
 @click.pass_context
-def find_stale_consumers(ctx):
+def find_stale_consumers(ctx, refresh):
     """Find stale consumer groups."""
     commander = ctx.obj['commander']
-    commander.find_stale_consumers()
+    commander.find_stale_consumers(refresh=refresh)
 
 
 @find.command('unused-topics')
+@click.option('--verbose', '-v', is_flag=True, help='Read the last message of unused topics to report their age')
 @click.pass_context
-def find_unused_topics(ctx):
+def find_unused_topics(ctx, verbose):
     """Find unused topics."""
     commander = ctx.obj['commander']
-    commander.find_unused_topics()
+    commander.find_unused_topics(verbose=verbose)
 
 
 @cli.group()
@@ -495,29 +1095,31 @@ def delete():
 
 
 @delete.command('group')
-@click.argument('group_name')
+@click.argument('group_names', nargs=-1, required=True)
+@click.option('--yes', '-y', is_flag=True, help='Skip the confirmation prompt')
 @click.pass_context
-def delete_group(ctx, group_name):
-    """Delete a consumer group."""
+def delete_group(ctx, group_names, yes):
+    """Delete one or more consumer groups."""
     commander = ctx.obj['commander']
-    commander.delete_consumer_group(group_name)
+    commander.delete_consumer_groups(list(group_names), yes=yes)
 
 
 @delete.command('topic')
 @click.argument('topic_name')
+@click.option('--yes', '-y', is_flag=True, help='Skip the confirmation prompt')
 @click.pass_context
-def delete_topic(ctx, topic_name):
+def delete_topic(ctx, topic_name, yes):
     """Delete a topic."""
     commander = ctx.obj['commander']
-    commander.delete_topic(topic_name)
+    commander.delete_topic(topic_name, yes=yes)
 
 
 if __name__ == '__main__':
     try:
         cli()
     except KeyboardInterrupt:
-        click.echo(f"\n{Fore.YELLOW}Operation cancelled by user.{Style.RESET_ALL}")
+        click.echo(f"\n{C.YELLOW}Operation cancelled by user.{C.RESET}")
         sys.exit(0)
     except Exception as e:
-        click.echo(f"{Fore.RED}Unexpected error: {e}{Style.RESET_ALL}")
+        click.echo(f"{C.RED}Unexpected error: {e}{C.RESET}")
         sys.exit(1)
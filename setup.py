@@ -20,20 +20,23 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.9",
     install_requires=[
         "PyYAML>=6.0.1",
         "boto3>=1.34.0",
         "kafka-python>=2.0.2",
         "click>=8.1.7",
         "colorama>=0.4.6",
+        "numpy>=1.21.0",
+        "aiokafka>=0.10.0",
     ],
+    extras_require={
+        "jit": ["numba>=0.57.0"],
+    },
     entry_points={
         "console_scripts": [
             "kafka-lens=kafka_lens:cli",